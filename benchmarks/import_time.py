@@ -0,0 +1,72 @@
+"""
+Замер времени холодного импорта пакета py_rutracker.
+
+Каждый замер выполняется в отдельном процессе интерпретатора, чтобы
+модули не попадали в кэш sys.modules между запусками.
+
+Запуск:
+    python benchmarks/import_time.py [--runs 10]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "import py_rutracker": "import py_rutracker",
+    "RuTrackerClient": "from py_rutracker import RuTrackerClient",
+    "AsyncRuTrackerClient": "from py_rutracker import AsyncRuTrackerClient",
+}
+
+TIMER = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, int("aiohttp" in sys.modules), int("requests" in sys.modules))
+"""
+
+
+def measure(statement: str, runs: int) -> tuple[list[float], bool, bool]:
+    """
+    Выполняет `statement` в новых процессах и возвращает время импорта
+    в секундах и признаки загрузки aiohttp и requests.
+    """
+    timings = []
+    aiohttp_loaded = requests_loaded = False
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement=statement)],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        timings.append(float(output[0]))
+        aiohttp_loaded = output[1] == "1"
+        requests_loaded = output[2] == "1"
+    return timings, aiohttp_loaded, requests_loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for name, statement in SCENARIOS.items():
+        timings, aiohttp_loaded, requests_loaded = measure(statement, args.runs)
+        print(
+            f"{name:<24} "
+            f"median {statistics.median(timings) * 1000:8.2f} ms  "
+            f"min {min(timings) * 1000:8.2f} ms  "
+            f"aiohttp={'yes' if aiohttp_loaded else 'no':<3} "
+            f"requests={'yes' if requests_loaded else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,30 @@
-from py_rutracker.client import RuTrackerClient
-from py_rutracker.asyn_client import AsyncRuTrackerClient
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from py_rutracker.client import RuTrackerClient
+    from py_rutracker.asyn_client import AsyncRuTrackerClient
+
+__all__ = ["RuTrackerClient", "AsyncRuTrackerClient"]
+
+_LAZY_IMPORTS = {
+    "RuTrackerClient": "py_rutracker.client",
+    "AsyncRuTrackerClient": "py_rutracker.asyn_client",
+}
+
+
+def __getattr__(name: str):
+    """
+    Лениво импортирует клиенты при первом обращении, чтобы импорт пакета
+    не загружал requests, aiohttp и остальные зависимости заранее.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,11 @@
 import aiohttp
 import asyncio
 import certifi
+import copy
 import ssl
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Hashable
 
 from .enums import Url
 from .datacls import SearchResult
@@ -14,6 +18,27 @@ from .exceptions import (
 
 )
 
+@lru_cache(maxsize=None)
+def get_ssl_context() -> ssl.SSLContext:
+    """
+    Возвращает SSL-контекст с сертификатами certifi.
+    Контекст создаётся один раз при первом запросе и переиспользуется в процессе.
+    """
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+@dataclass
+class _InFlightCall:
+    """
+    Выполняющийся запрос, результат которого ожидают несколько вызовов.
+
+    :param task: Задача, выполняющая запрос.
+    :param waiters: Количество вызовов, ожидающих результат задачи.
+    """
+    task: asyncio.Future
+    waiters: int = field(default=0)
+
+
 class AsyncRuTrackerClient:
     def __init__(
             self,
@@ -28,10 +53,12 @@ class AsyncRuTrackerClient:
         self.proxy = proxy
         self.session = None
         self.parser = ParsingPage()
-        self._ssl_context = ssl.create_default_context(
-            cafile=certifi.where()
-        )
+        self._in_flight: dict[Hashable, _InFlightCall] = {}
+        self.coalesced_calls = 0
 
+    @property
+    def _ssl_context(self) -> ssl.SSLContext:
+        return get_ssl_context()
 
     async def init(self)-> aiohttp.ClientSession:
         """ 
@@ -72,15 +99,80 @@ class AsyncRuTrackerClient:
         except Exception as _ex:
             raise RuTrackerAuthError(f"Ошибка при выполнении запроса: {_ex}")
 
+    async def _single_flight(
+            self,
+            key: Hashable,
+            coro_factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Объединяет одновременные одинаковые запросы в один.
+
+        Первый вызов с ключом `key` запускает задачу, остальные конкурентные
+        вызовы с тем же ключом ожидают её результат. Отмена одного из
+        ожидающих не отменяет общую задачу; задача отменяется только тогда,
+        когда её больше никто не ожидает.
+
+        :param key: Ключ запроса.
+        :param coro_factory: Функция, возвращающая корутину запроса.
+        :return: Результат выполнения запроса.
+        """
+        entry = self._in_flight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(coro_factory())
+            entry = _InFlightCall(task)
+            self._in_flight[key] = entry
+
+            def _release(_: asyncio.Future) -> None:
+                if self._in_flight.get(key) is entry:
+                    del self._in_flight[key]
+
+            task.add_done_callback(_release)
+        else:
+            task = entry.task
+            self.coalesced_calls += 1
+
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not task.done():
+                task.cancel()
+                if self._in_flight.get(key) is entry:
+                    del self._in_flight[key]
+
 
     async def search(
             self, 
             title: str, 
             page: int = 1,
             return_search_dict: bool = False
+    ) -> list[SearchResult]:
+        """
+        Выполняет поиск по заданному заголовку и возвращает результаты.
+        Одновременные вызовы с одинаковыми параметрами выполняют один запрос.
+
+        :param title: Заголовок для поиска.
+        :param page: Номер страницы для поиска (по умолчанию 1).
+        :param return_search_dict: Флаг, указывающий, следует ли возвращать результаты
+        в виде словарей (если True) или объектов SearchResult (если False).
+        :return: Список результатов поиска. Каждый вызов получает собственные
+        копии результатов, даже если запрос был объединён с другими.
+        """
+        results = await self._single_flight(
+            ("search", title, page, return_search_dict),
+            lambda: self._search(title, page, return_search_dict)
+        )
+        return [copy.copy(result) for result in results]
+
+    async def _search(
+            self, 
+            title: str, 
+            page: int,
+            return_search_dict: bool
     ) -> list[SearchResult]:
          """
-         
+         Выполняет запрос поиска и парсит результаты.
          """
          url = Url.SEARCH.value
          params = {
@@ -158,6 +250,15 @@ class AsyncRuTrackerClient:
                 "или URL (str), начинающийся с 'https://rutracker.org/forum/dl.php?t='."
             )
 
+        return await self._single_flight(
+            ("download", url, tuple(params.items()) if params else None),
+            lambda: self._download(url, params)
+        )
+
+    async def _download(self, url: str, params: dict | None) -> bytes:
+        """
+        Выполняет запрос на получение файла торрента.
+        """
         async with self.session.get(
             url, 
             params=params, 
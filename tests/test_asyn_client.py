@@ -0,0 +1,86 @@
+import asyncio
+import unittest
+
+from py_rutracker.asyn_client import AsyncRuTrackerClient
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.client = AsyncRuTrackerClient("login", "password")
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def _search(self, title, page, return_search_dict):
+        self.calls += 1
+        self.started.set()
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return [{"title": title, "page": page}]
+
+    async def test_identical_calls_share_one_request(self) -> None:
+        self.client._search = self._search
+        tasks = [asyncio.create_task(self.client.search("x")) for _ in range(3)]
+        other = asyncio.create_task(self.client.search("y"))
+        await self.started.wait()
+        self.release.set()
+        results = await asyncio.gather(*tasks, other)
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.client.coalesced_calls, 2)
+        self.assertEqual(results[0], [{"title": "x", "page": 1}])
+        self.assertEqual(results[3], [{"title": "y", "page": 1}])
+        self.assertIsNot(results[0][0], results[1][0])
+        self.assertEqual(self.client._in_flight, {})
+
+    async def test_cancelled_waiter_keeps_shared_task(self) -> None:
+        self.client._search = self._search
+        first = asyncio.create_task(self.client.search("x"))
+        second = asyncio.create_task(self.client.search("x"))
+        await self.started.wait()
+        first.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        self.release.set()
+
+        self.assertEqual(await second, [{"title": "x", "page": 1}])
+        self.assertFalse(self.cancelled)
+        self.assertEqual(self.calls, 1)
+
+    async def test_cancelling_last_waiter_cancels_task(self) -> None:
+        self.client._search = self._search
+        task = asyncio.create_task(self.client.search("x"))
+        await self.started.wait()
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        self.assertTrue(self.cancelled)
+        self.assertEqual(self.client._in_flight, {})
+
+    async def test_error_reaches_every_waiter(self) -> None:
+        async def _download(url, params):
+            self.calls += 1
+            await self.release.wait()
+            raise RuntimeError("boom")
+
+        self.client._download = _download
+        tasks = [asyncio.create_task(self.client.download(1)) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.client.coalesced_calls, 2)
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+        self.assertEqual(self.client._in_flight, {})
+
+
+if __name__ == "__main__":
+    unittest.main()